@@ -1,19 +1,63 @@
 import asyncio
 import logging
-from collections import defaultdict
-from datetime import datetime
-from decimal import Decimal
+import os
+import time
+from dataclasses import dataclass
+from decimal import Context, Decimal, localcontext
 
 from binance import AsyncClient, BinanceSocketManager
 
 from exchanges.base import ExchangeWebSocket
 from utils import get_required_env
 from utils.string import f, price_f
-from utils.telegram import send_telegram_message
+from utils.telegram import MAX_MESSAGE_LENGTH, send_telegram_message
+
+# 자주 쓰는 Decimal 상수 (호출마다 문자열 파싱 방지)
+ZERO = Decimal("0")
+ONE = Decimal("1")
+HUNDRED = Decimal("100")  # 퍼센트 변환용
+DUST = Decimal("0.00001")  # 이 값보다 작은 수량은 0으로 취급
+
+# 체결 집계용 고정소수점 자릿수 (바이낸스 수량/가격은 소수점 8자리 이내)
+FP_DIGITS = 8
+
+# 알림 계산용 Decimal 컨텍스트 (표시에 충분한 정밀도만 사용, 트랩 없음)
+_CTX = Context(prec=18, traps=[])
+
+
+def _to_fp(s: str) -> int:
+    """
+    바이낸스 숫자 문자열을 소수점 FP_DIGITS자리 고정소수점 정수로 변환
+    예: "0.53" -> 53000000 (Decimal 생성 없이 문자열 연산만 사용)
+    """
+    whole, _, frac = s.partition(".")
+    return int(whole + frac[:FP_DIGITS].ljust(FP_DIGITS, "0"))
+
+
+@dataclass(slots=True)
+class PositionState:
+    """심볼별 포지션 상태 (slots 사용으로 dict 대비 메모리/속성 접근 비용 절약)"""
+
+    amt: Decimal = ZERO  # 포지션 수량 (실제 수량)
+    price: Decimal = ZERO  # 평단가
+    cum_pnl: Decimal = ZERO  # 누적 실현 손익
 
 
 class BinanceWebSocket(ExchangeWebSocket):
     SIMULATION_MULTIPLIER = Decimal("100")
+    # 배수 적용 전 실제 수량 기준의 DUST (전체 청산 판정 시 곱셈 생략)
+    _DUST_RAW = DUST / SIMULATION_MULTIPLIER
+    # 체결 취합 대기 시간 (초): 짧게 기다린 뒤, 추가 이벤트가 예상되면 상한까지 연장
+    FLUSH_DELAY = 0.2
+    FLUSH_EXTEND = 0.4
+    FLUSH_MAX_DELAY = 1.5
+    # 텔레그램 알림을 모아서 보내는 간격 (초)
+    TELEGRAM_BATCH_DELAY = 0.2
+    # /pos 현재가 캐시 유지 시간 (초)
+    TICKER_CACHE_TTL = 1.0
+    # 보유 심볼이 이 개수 이하면 전체 시세 대신 심볼별로 조회
+    # (ticker/price 가중치: 심볼당 1, 전체 2 -> 1개일 때만 이득)
+    TICKER_SINGLE_LIMIT = 1
 
     def __init__(self):
         super().__init__(
@@ -23,18 +67,41 @@ class BinanceWebSocket(ExchangeWebSocket):
         self.client = None
         self.bm = None
 
-        self.wallet_balance = Decimal("0")
-        self.leverage_map = defaultdict(lambda: Decimal("1"))
-        self.active_positions = defaultdict(
-            lambda: {
-                "amt": Decimal("0"),
-                "price": Decimal("0"),
-                "cum_pnl": Decimal("0"),
-            }
-        )
+        # DEBUG_WS 환경변수가 있으면 전송하는 알림을 콘솔에도 출력 (디버깅용)
+        self._debug = bool(os.getenv("DEBUG_WS"))
+
+        self.wallet_balance = ZERO
+        # 레버리지 정보가 없는 심볼은 조회 시 1배로 취급
+        # (조회만으로 키가 생기지 않도록 defaultdict 대신 dict 사용)
+        self.leverage_map: dict[str, Decimal] = {}
+        # 포지션은 _sync_initial_positions / _update_wallet 에서만 추가
+        self.active_positions: dict[str, PositionState] = {}
+
+        # 심볼별 체결 집계 (주문 목록 대신 누적값만 보관)
+        self.msg_agg: dict[str, dict] = {}
+        self.flush_timers: dict[str, asyncio.TimerHandle] = {}
+
+        # 현재가 캐시 (조회 시각, 심볼별 현재가)
+        self._ticker_cache: tuple[float, dict[str, Decimal]] | None = None
+        # 심볼별 마지막 ACCOUNT_UPDATE 거래 시각 (바이낸스 "T", ms)
+        # 수신 순서는 보장되지 않으므로 로컬 수신 시각 대신 거래 시각으로 비교
+        self._last_account_update_ts: dict[str, int] = {}
+
+        # 텔레그램 전송 대기열 (_tg_drain 태스크 하나가 모아서 전송)
+        self._tg_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._tg_task = None
 
-        self.msg_buffer = defaultdict(list)
-        self.flush_tasks = {}
+        # 알림 시각 문자열 캐시 (초 단위, 문자열)
+        self._now_cache: tuple[int, str] = (0, "")
+
+        # 이벤트 타입별 처리기 (그 외 이벤트는 무시)
+        self._handlers = {
+            # 1. 계좌 변동이 오면 내 지갑(메모리)을 즉시 갱신
+            "ACCOUNT_UPDATE": self._update_wallet,
+            # 2. 주문 체결이 오면 버퍼에 넣고 타이머 시작
+            "ORDER_TRADE_UPDATE": self._buffer_order,
+            "ACCOUNT_CONFIG_UPDATE": self._update_leverage,
+        }
 
     async def _sync_initial_positions(self):
         """봇 시작 시 현재 포지션 상태, 지갑 잔고, 레버리지 동기화"""
@@ -51,8 +118,8 @@ class BinanceWebSocket(ExchangeWebSocket):
                 amt = Decimal(str(position["positionAmt"]))
                 ep = Decimal(str(position["entryPrice"]))
 
-                if amt != Decimal("0"):
-                    self.active_positions[symbol].update({"amt": amt, "price": ep})
+                if amt != ZERO:
+                    self.active_positions[symbol] = PositionState(amt, ep)
 
                 logging.info(
                     f"초기화 - {symbol}: 레버리지 {self.leverage_map[symbol]}x"
@@ -66,6 +133,8 @@ class BinanceWebSocket(ExchangeWebSocket):
         self.client = await AsyncClient.create(self.api_key, self.secret_key)
         await self._sync_initial_positions()
 
+        self._tg_task = asyncio.create_task(self._tg_drain())
+
         self.bm = BinanceSocketManager(self.client)
         ts = self.bm.futures_user_socket()
 
@@ -80,17 +149,9 @@ class BinanceWebSocket(ExchangeWebSocket):
 
     def _handle_socket_message(self, msg):
         try:
-            event_type = msg.get("e")
-
-            # 1. 계좌 변동이 오면 내 지갑(메모리)을 즉시 갱신
-            if event_type == "ACCOUNT_UPDATE":
-                self._update_wallet(msg)
-
-            # 2. 주문 체결이 오면 버퍼에 넣고 타이머 시작
-            elif event_type == "ORDER_TRADE_UPDATE":
-                self._buffer_order(msg)
-            elif event_type == "ACCOUNT_CONFIG_UPDATE":
-                self._update_leverage(msg)
+            handler = self._handlers.get(msg.get("e"))
+            if handler is not None:
+                handler(msg)
 
         except Exception as e:
             logging.error(f"처리 중 에러: {e}")
@@ -103,14 +164,37 @@ class BinanceWebSocket(ExchangeWebSocket):
             if b["a"] == "USDT":
                 self.wallet_balance = Decimal(str(b["wb"]))
 
+        txn_ts = msg.get("T", 0)  # 이 계좌 변동의 거래 시각
+        ready = []
+
+        # 루프 안에서 반복되는 속성 조회를 지역 변수로 한 번만
+        positions = self.active_positions
+        last_update_ts = self._last_account_update_ts
+        msg_agg = self.msg_agg
+
         for p in data.get("P", []):
             symbol = p["s"]
             amt = Decimal(str(p["pa"]))  # 포지션 수량
             ep = Decimal(str(p["ep"]))  # 최신 평단가
 
-            self.active_positions[symbol]["amt"] = amt
-            if amt != Decimal("0"):
-                self.active_positions[symbol]["price"] = ep
+            pos = positions.get(symbol)
+            if pos is None:
+                positions[symbol] = PositionState(amt, ep)
+            else:
+                pos.amt = amt
+                if amt != ZERO:
+                    pos.price = ep
+
+            last_update_ts[symbol] = txn_ts
+
+            # 이 ACCOUNT_UPDATE를 기다리며 대기를 연장 중이었다면 바로 전송
+            agg = msg_agg.get(symbol)
+            if agg and agg["extended"] and not self._should_wait(symbol, agg):
+                ready.append(symbol)
+
+        for symbol in ready:
+            self.flush_timers.pop(symbol).cancel()
+            self._flush_buffer(symbol)
 
     def _update_leverage(self, msg):
         """ACCOUNT_CONFIG_UPDATE 처리: 레버리지 변경 시 메모리 갱신"""
@@ -133,58 +217,120 @@ class BinanceWebSocket(ExchangeWebSocket):
             return
 
         symbol = order_data.get("s")
-        self.msg_buffer[symbol].append(order_data)
-
-        # 타이머가 없으면 시작
-        if symbol not in self.flush_tasks:
-            self.flush_tasks[symbol] = asyncio.create_task(self._flush_buffer(symbol))
-
-    def aggregate_order_buffer(
-        self, orders: list[dict[str, any]], multiplier: Decimal
-    ) -> dict[str, any]:
-        """
-        주문 목록을 받아 집계된 데이터를 반환하는 순수 함수
-        """
-        total_qty = Decimal("0")  # 총 체결 수량
-        total_val = Decimal("0")  # 총 체결 금액 (평단 계산용)
-
-        side = orders[0]["S"]
-        is_reduce = any(o.get("R", False) for o in orders)
-
-        for o in orders:
-            q = Decimal(str(o.get("l", "0"))) * multiplier
-            p = Decimal(str(o.get("ap", "0")))  # 체결 가격
-
-            total_qty += q
-            total_val += p * q
-
-        # 실행 평단가 계산 (0으로 나누기 방지)
-        exec_avg_price = total_val / total_qty if total_qty > 0 else Decimal("0")
-
-        return {
-            "total_qty": total_qty,
-            "exec_avg_price": exec_avg_price,
-            "side": side,
-            "is_reduce": is_reduce,
-        }
+
+        # 집계는 고정소수점 정수로 처리 (Decimal은 알림 메시지 만들 때만 사용)
+        q = _to_fp(order_data.get("l") or "0")
+        p = _to_fp(order_data.get("ap") or "0")  # 체결 가격
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        trade_ts = order_data.get("T", 0)  # 체결 거래 시각 (바이낸스 "T", ms)
+
+        # 심볼별 누적값만 갱신 (버스트 크기와 관계없이 심볼당 메모리 O(1))
+        agg = self.msg_agg.get(symbol)
+        if agg is None:
+            self.msg_agg[symbol] = {
+                "qty": q,  # 총 체결 수량 (배수 적용 전, 10^FP_DIGITS 배)
+                "val": p * q,  # 총 체결 금액 (평단 계산용, 10^(2*FP_DIGITS) 배)
+                "side": order_data["S"],
+                "reduce": bool(order_data.get("R", False)),
+                "status": order_data["X"],  # 마지막 체결 상태
+                "start_ts": now,  # 첫 체결 시각
+                "trade_ts": trade_ts,  # 마지막 체결의 거래 시각
+                "extended": False,
+            }
+        else:
+            agg["qty"] += q
+            agg["val"] += p * q
+            agg["reduce"] = agg["reduce"] or bool(order_data.get("R", False))
+            agg["status"] = order_data["X"]
+            if trade_ts > agg["trade_ts"]:
+                agg["trade_ts"] = trade_ts
+
+        # 타이머가 없으면 시작 (Task 대신 가벼운 TimerHandle 예약)
+        if symbol not in self.flush_timers:
+            self.flush_timers[symbol] = loop.call_later(
+                self.FLUSH_DELAY, self._on_flush_timer, symbol
+            )
+
+    def _should_wait(self, symbol, agg):
+        """추가 체결이나 ACCOUNT_UPDATE가 아직 올 것으로 보이면 True"""
+        # 1. 주문이 아직 부분 체결 상태
+        if agg["status"] == "PARTIALLY_FILLED":
+            return True
+        # 2. 마지막 체결을 반영한 ACCOUNT_UPDATE(평단/수량)가 아직 안 옴
+        # (같거나 이후 거래의 ACCOUNT_UPDATE가 체결보다 먼저 왔다면 기다리지 않음)
+        return self._last_account_update_ts.get(symbol, -1) < agg["trade_ts"]
+
+    def _on_flush_timer(self, symbol):
+        """취합 타이머 만료: 기다릴 이유가 있으면 상한까지 연장, 아니면 전송"""
+        agg = self.msg_agg.get(symbol)
+        if agg is None:
+            self.flush_timers.pop(symbol, None)
+            return
+
+        loop = asyncio.get_running_loop()
+        remaining = self.FLUSH_MAX_DELAY - (loop.time() - agg["start_ts"])
+
+        if remaining > 0 and self._should_wait(symbol, agg):
+            agg["extended"] = True
+            self.flush_timers[symbol] = loop.call_later(
+                min(self.FLUSH_EXTEND, remaining), self._on_flush_timer, symbol
+            )
+            return
+
+        self._flush_buffer(symbol)
+
+    async def _get_price_map(self, symbols):
+        """현재가 조회 (TTL 동안 캐시 사용, 보유 심볼이 적으면 심볼별 조회)"""
+        now = time.monotonic()
+        cache = self._ticker_cache
+        if (
+            cache
+            and now - cache[0] < self.TICKER_CACHE_TTL
+            and all(s in cache[1] for s in symbols)
+        ):
+            return cache[1]
+
+        if len(symbols) <= self.TICKER_SINGLE_LIMIT:
+            tickers = await asyncio.gather(
+                *(self.client.futures_symbol_ticker(symbol=s) for s in symbols),
+                return_exceptions=True,
+            )
+            # 조회 실패 심볼(상장폐지/정산 중 등)은 빼고 호출하는 쪽에서 평단가로 대체
+            price_map = {}
+            for s, t in zip(symbols, tickers, strict=True):
+                if isinstance(t, BaseException):
+                    logging.error(f"현재가 조회 에러 ({s}): {t}")
+                    continue
+                price_map[t["symbol"]] = Decimal(t["price"])
+        else:
+            # 전체 시세 중 보유 심볼만 Decimal 로 변환
+            tickers = await self.client.futures_symbol_ticker()
+            wanted = set(symbols)
+            price_map = {
+                t["symbol"]: Decimal(t["price"])
+                for t in tickers
+                if t["symbol"] in wanted
+            }
+        self._ticker_cache = (now, price_map)
+        return price_map
 
     async def get_positions_with_pnl(self):
         """현재 포지션 + 실현손익 + 시드 비중 조회"""
         if not self.active_positions or not self.client:
             return []
 
-        active_symbols = [
-            s
-            for s, data in self.active_positions.items()
-            if data["amt"] != Decimal("0")
-        ]
-        if not active_symbols:
+        # 심볼 -> 포지션 (루프에서 active_positions 를 다시 조회하지 않도록 함께 보관)
+        active = {
+            s: data for s, data in self.active_positions.items() if data.amt != ZERO
+        }
+        if not active:
             return []
 
         try:
             # 1. 현재가 조회 (PNL 계산을 위해 현재가는 여전히 API나 별도 소켓 필요)
-            all_tickers = await self.client.futures_symbol_ticker()
-            price_map = {t["symbol"]: Decimal(str(t["price"])) for t in all_tickers}
+            price_map = await self._get_price_map(active)
 
             # [삭제됨] 기존의 futures_position_information() 호출 부분 제거!
             # (레버리지는 self.leverage_map 메모리에서 바로 가져올 예정)
@@ -193,48 +339,47 @@ class BinanceWebSocket(ExchangeWebSocket):
             logging.error(f"포지션 정보 조회 에러: {e}")
             return []
 
+        # 루프 동안 바뀌지 않는 값은 한 번만 꺼내둠
+        # [수정] 메모리(self.leverage_map)에서 해당 심볼의 레버리지를 즉시 꺼내옴 ⚡
+        # (없을 경우를 대비해 getattr로 방어 로직 추가)
+        mul = self.SIMULATION_MULTIPLIER
+        leverage_map = getattr(self, "leverage_map", {})
+        # 이전 단계에서 추가했던 self.wallet_balance를 사용합니다.
+        wallet_balance = getattr(self, "wallet_balance", ZERO)
+
         results = []
-        for symbol in active_symbols:
-            data = self.active_positions[symbol]
-            entry_price = data["price"]
-            raw_amt = data["amt"]  # 실제 수량
+        for symbol, data in active.items():
+            entry_price = data.price
+            raw_amt = data.amt  # 실제 수량
+            raw_abs = -raw_amt if raw_amt < ZERO else raw_amt  # 실제 수량 크기
 
-            sim_amt = raw_amt * self.SIMULATION_MULTIPLIER  # 뻥튀기 된 수량
+            sim_amt = raw_amt * mul  # 뻥튀기 된 수량
 
             # 메모리에 누적된 실현 손익 가져오기
-            realized_pnl = data.get("cum_pnl", Decimal("0"))
+            realized_pnl = data.cum_pnl
 
             current_price = price_map.get(symbol, entry_price)
 
             # 미실현 PNL 및 ROE 계산
             pnl = (current_price - entry_price) * sim_amt
-            entry_value = entry_price * abs(sim_amt)
-            roe = (pnl / entry_value) * 100 if entry_value > 0 else Decimal("0")
+
+            # 뻥튀기 전 실제 수량 기준 포지션 가치 (ROE와 비중에 함께 사용)
+            real_position_value = entry_price * raw_abs
+            entry_value = real_position_value * mul
+            roe = (pnl / entry_value) * HUNDRED if entry_value > 0 else ZERO
 
             # =========================================================
             # [추가] 시드 대비 비중 계산
             # =========================================================
 
-            # [수정] 메모리(self.leverage_map)에서 해당 심볼의 레버리지를 즉시 꺼내옴 ⚡
-            # (없을 경우를 대비해 getattr로 방어 로직 추가)
-            leverage_map = getattr(self, "leverage_map", {})
-            leverage = leverage_map.get(symbol, Decimal("1"))
-
-            # 뻥튀기 전 실제 수량을 기준으로 실제 포지션 가치 계산
-            real_position_value = entry_price * abs(raw_amt)
+            leverage = leverage_map.get(symbol, ONE)
 
             # 실제 들어간 내 증거금 = 총 가치 / 레버리지
-            margin_used = (
-                real_position_value / leverage if leverage > 0 else Decimal("0")
-            )
+            margin_used = real_position_value / leverage if leverage > 0 else ZERO
 
             # 시드 대비 비중 (%)
-            # 이전 단계에서 추가했던 self.wallet_balance를 사용합니다.
-            wallet_balance = getattr(self, "wallet_balance", Decimal("0"))
             seed_usage_percent = (
-                (margin_used / wallet_balance) * 100
-                if wallet_balance > 0
-                else Decimal("0")
+                (margin_used / wallet_balance) * HUNDRED if wallet_balance > 0 else ZERO
             )
 
             results.append(
@@ -253,34 +398,56 @@ class BinanceWebSocket(ExchangeWebSocket):
             )
         return results
 
-    async def _flush_buffer(self, symbol):
-        """0.5초 대기 후 데이터를 취합해서 알림 전송 (디자인 업그레이드 버전)"""
-
-        await asyncio.sleep(0.5)
+    def _flush_buffer(self, symbol):
+        """취합 대기가 끝난 체결 데이터를 모아서 알림 전송 (디자인 업그레이드 버전)"""
 
-        orders = self.msg_buffer.pop(symbol, [])
-        if symbol in self.flush_tasks:
-            del self.flush_tasks[symbol]
+        agg = self.msg_agg.pop(symbol, None)
+        self.flush_timers.pop(symbol, None)
 
-        if not orders:
+        if not agg:
             return
 
-        agg_data = self.aggregate_order_buffer(orders, self.SIMULATION_MULTIPLIER)
-
-        total_qty = agg_data["total_qty"]
-        exec_avg_price = agg_data["exec_avg_price"]
-        side = agg_data["side"]
-        is_reduce = agg_data["is_reduce"]
+        with localcontext(_CTX):
+            msg = self._build_flush_message(symbol, agg)
+
+        if self._debug:
+            print(msg)
+            print("-" * 30)
+        self._tg_queue.put_nowait(msg)
+
+    def _now_str(self):
+        """현재 시각 문자열 (같은 초 안에서는 이전 결과 재사용)"""
+        sec = int(time.time())
+        cache = self._now_cache
+        if cache[0] != sec:
+            cache = (sec, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec)))
+            self._now_cache = cache
+        return cache[1]
+
+    def _build_flush_message(self, symbol, agg):
+        """집계된 체결 데이터로 손익/비중을 계산하고 알림 메시지 작성"""
+        mul = self.SIMULATION_MULTIPLIER
+        wallet_balance = self.wallet_balance
+
+        # 배수는 여기서 한 번만 적용 (평단가는 배수가 약분되므로 원본 값으로 계산)
+        qty_fp = agg["qty"]
+        total_qty = Decimal(qty_fp).scaleb(-FP_DIGITS) * mul
+        exec_avg_price = (
+            Decimal(agg["val"] // qty_fp).scaleb(-FP_DIGITS) if qty_fp > 0 else ZERO
+        )
+        side = agg["side"]
+        is_reduce = agg["reduce"]
 
         # 지갑 상태 조회
-        wallet = self.active_positions.get(
-            symbol,
-            {"amt": Decimal("0"), "price": Decimal("0"), "cum_pnl": Decimal("0")},
-        )
-        entry_price = wallet["price"]
-        final_amt = abs(wallet["amt"]) * self.SIMULATION_MULTIPLIER
+        # 포지션 정보가 없는 심볼이면 None (값은 0으로 보고 메모리는 건드리지 않음)
+        wallet = self.active_positions.get(symbol)
+        if wallet is not None:
+            entry_price = wallet.price
+            raw_amt = abs(wallet.amt)  # 배수 적용 전 실제 보유 수량
+        else:
+            entry_price = raw_amt = ZERO
 
-        calc_pnl = Decimal("0")
+        calc_pnl = ZERO
         if is_reduce and entry_price > 0:
             # 1. 숏 포지션 청산 (BUY 주문)
             # 이익 = (진입가 - 체결가) * 수량
@@ -293,10 +460,12 @@ class BinanceWebSocket(ExchangeWebSocket):
                 calc_pnl = (exec_avg_price - entry_price) * total_qty
 
         # 손익 누적 (메모리 업데이트)
-        if calc_pnl != 0:
-            self.active_positions[symbol]["cum_pnl"] += calc_pnl
-
-        cumulative_pnl = self.active_positions[symbol]["cum_pnl"]
+        if wallet is not None:
+            if calc_pnl != 0:
+                wallet.cum_pnl += calc_pnl
+            cumulative_pnl = wallet.cum_pnl
+        else:
+            cumulative_pnl = ZERO
 
         # 포지션 방향 및 색상
         if is_reduce or calc_pnl != 0:
@@ -306,115 +475,134 @@ class BinanceWebSocket(ExchangeWebSocket):
             pos_side = "LONG" if side == "BUY" else "SHORT"
             side_color = "🟢" if pos_side == "LONG" else "🔴"
 
-        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        leverage = self.leverage_map[symbol]
+        now_str = self._now_str()
 
-        # 메시지 작성을 위한 리스트 (나중에 join으로 합침)
-        lines = []
+        leverage = self.leverage_map.get(symbol, ONE)
 
         # =========================================================
         # Case A: 청산 (익절 / 손절)
         # =========================================================
-        if calc_pnl != Decimal("0") or is_reduce:
+        if calc_pnl != ZERO or is_reduce:
             # 1. 전체 청산
-            if final_amt < Decimal("0.00001"):
-                lines.append(f"💵 *전체 청산 ({pos_side})*")
-                lines.append("")
-                lines.append(f"• *종목*:{side_color} `{symbol} ({leverage}x)`")
-                lines.append("──────────────")
-                lines.append(f"• *정리수량*: `{total_qty:,}`")
-                lines.append(f"• *종료가격*: `{f(exec_avg_price)}`")
-                lines.append(f"• *마지막 손익*: `{f(calc_pnl, '0.001')}` USDT")
-                lines.append("──────────────")
-                lines.append(f"💰*최종 확정이익*: `{f(cumulative_pnl, '0.001')}` USDT")
+            if raw_amt < self._DUST_RAW:
+                msg = (
+                    f"💵 *전체 청산 ({pos_side})*\n"
+                    "\n"
+                    f"• *종목*:{side_color} `{symbol} ({leverage}x)`\n"
+                    "──────────────\n"
+                    f"• *정리수량*: `{f(total_qty)}`\n"
+                    f"• *종료가격*: `{f(exec_avg_price)}`\n"
+                    f"• *마지막 손익*: `{f(calc_pnl, '0.001')}` USDT\n"
+                    "──────────────\n"
+                    f"💰*최종 확정이익*: `{f(cumulative_pnl, '0.001')}` USDT\n"
+                    f"• *시간*: `{now_str}`"
+                )
                 # 리셋
-                self.active_positions[symbol]["cum_pnl"] = Decimal("0")
+                if wallet is not None:
+                    wallet.cum_pnl = ZERO
 
             # 2. 부분 청산``
             else:
+                final_amt = raw_amt * mul
                 pnl_icon = "🎉" if calc_pnl > 0 else "💧"
                 cum_icon = "💰" if cumulative_pnl > 0 else "💸"
 
                 # 청산한 비율 퍼센트 계산
-                liquidation_ratio = (total_qty / (total_qty + final_amt)) * Decimal(
-                    "100"
-                )
-
-                lines.append(f"⚠️*부분 청산 ({pos_side})*")
-                lines.append("")
-                lines.append(f"• *종목*:{side_color} `{symbol} ({leverage}x)`")
-                lines.append("──────────────")
-                lines.append(f"• *이전수량*: `{(total_qty + final_amt):,}`")
-                lines.append(
-                    f"• *정리수량*: `{total_qty:,}` ({f(liquidation_ratio, '0.01')}%)"
-                )
-                lines.append(f"• *남은수량*: `{final_amt:,}`")
-                lines.append(f"• *체결가격*: `{f(exec_avg_price)}`")
-                lines.append("──────────────")
-                lines.append(f"• *이번손익*: {pnl_icon} `{f(calc_pnl, '0.001')}` USDT")
-                lines.append(
-                    f"• *누적실현*: {cum_icon} `{f(cumulative_pnl, '0.001')}` USDT"
+                liquidation_ratio = (total_qty / (total_qty + final_amt)) * HUNDRED
+
+                msg = (
+                    f"⚠️*부분 청산 ({pos_side})*\n"
+                    "\n"
+                    f"• *종목*:{side_color} `{symbol} ({leverage}x)`\n"
+                    "──────────────\n"
+                    f"• *이전수량*: `{f(total_qty + final_amt)}`\n"
+                    f"• *정리수량*: `{f(total_qty)}` "
+                    f"({f(liquidation_ratio, '0.01')}%)\n"
+                    f"• *남은수량*: `{f(final_amt)}`\n"
+                    f"• *체결가격*: `{f(exec_avg_price)}`\n"
+                    "──────────────\n"
+                    f"• *이번손익*: {pnl_icon} `{f(calc_pnl, '0.001')}` USDT\n"
+                    f"• *누적실현*: {cum_icon} `{f(cumulative_pnl, '0.001')}` USDT\n"
+                    f"• *시간*: `{now_str}`"
                 )
         # =========================================================
         # Case B: 진입 (신규 / 추가)
         # =========================================================
         else:
+            final_amt = raw_amt * mul
             prev_amt = final_amt - total_qty
 
             # [수정] API 호출 없이 메모리에서 바로 레버리지 가져오기 ⚡
 
-            # 봇에서 100배 뻥튀기 된 수량을 실제 수량으로 되돌림
-            actual_final_amt = final_amt / self.SIMULATION_MULTIPLIER
-
-            # 현재 포지션의 총 가치 (실제 수량 * 진입 평단가)
-            total_position_value = actual_final_amt * entry_price
+            # 현재 포지션의 총 가치 (뻥튀기 전 실제 수량 * 진입 평단가)
+            total_position_value = raw_amt * entry_price
 
             # 실제 들어간 내 돈(증거금) = 총 가치 / 레버리지
-            margin_used = (
-                total_position_value / leverage if leverage > 0 else Decimal("0")
-            )
+            margin_used = total_position_value / leverage if leverage > 0 else ZERO
 
             # 시드 대비 비중 (%)
             seed_usage_percent = (
-                (margin_used / self.wallet_balance) * 100
-                if self.wallet_balance > 0
-                else Decimal("0")
+                (margin_used / wallet_balance) * HUNDRED if wallet_balance > 0 else ZERO
             )
 
-            if prev_amt < Decimal("0.00001"):
-                # 신규 진입
-                self.active_positions[symbol]["cum_pnl"] = Decimal("0")
-
-                lines.append(f"🍀 *신규 진입 ({pos_side})*")
-                lines.append("")
-                lines.append(f"• *종목*: {side_color} `{symbol} ({leverage}x)`")
-                lines.append("──────────────")
-                lines.append(f"• *진입수량*: `{f(total_qty)}`")
-                lines.append(f"• *진입가격*: `{price_f(exec_avg_price, symbol)}`")
-                lines.append(f"• *시드비중*: `{f(seed_usage_percent, '0.01')}%`")
+            if prev_amt < DUST:
+                # 신규 진입 (이전 누적 손익 리셋)
+                if wallet is not None:
+                    wallet.cum_pnl = ZERO
+
+                msg = (
+                    f"🍀 *신규 진입 ({pos_side})*\n"
+                    "\n"
+                    f"• *종목*: {side_color} `{symbol} ({leverage}x)`\n"
+                    "──────────────\n"
+                    f"• *진입수량*: `{f(total_qty)}`\n"
+                    f"• *진입가격*: `{price_f(exec_avg_price, symbol)}`\n"
+                    f"• *시드비중*: `{f(seed_usage_percent, '0.01')}%`\n"
+                    f"• *시간*: `{now_str}`"
+                )
             else:
                 # 추가 진입 (물타기/불타기)
-                lines.append(f"🌊 *추가 진입 ({pos_side})*")
-                lines.append("")
-                lines.append(f"• *종목*: {side_color} `{symbol} ({leverage}x)`")
-                lines.append("──────────────")
-                lines.append(f"• *추가수량*: `{f(total_qty)}`")
-                lines.append(f"• *추매가격*: `{price_f(exec_avg_price, symbol)}`")
-                lines.append(f"• *최종평단*: `{price_f(entry_price, symbol)}`")
-                lines.append(f"• *보유수량*: `{f(final_amt)}`")
-                lines.append(f"• *총 비중*: `{f(seed_usage_percent, '0.01')}%`")
-
-        # 공통 하단 (시간)
-        lines.append(f"• *시간*: `{now_str}`")
-
-        # 최종 메시지 조립
-        msg = "\n".join(lines)
-
-        print(msg)
-        print("-" * 30)
-        asyncio.create_task(send_telegram_message(msg))
+                msg = (
+                    f"🌊 *추가 진입 ({pos_side})*\n"
+                    "\n"
+                    f"• *종목*: {side_color} `{symbol} ({leverage}x)`\n"
+                    "──────────────\n"
+                    f"• *추가수량*: `{f(total_qty)}`\n"
+                    f"• *추매가격*: `{price_f(exec_avg_price, symbol)}`\n"
+                    f"• *최종평단*: `{price_f(entry_price, symbol)}`\n"
+                    f"• *보유수량*: `{f(final_amt)}`\n"
+                    f"• *총 비중*: `{f(seed_usage_percent, '0.01')}%`\n"
+                    f"• *시간*: `{now_str}`"
+                )
+
+        # 브랜치마다 메시지 전체를 f-string 하나로 만들어 리스트 append/join 비용 제거
+        return msg
+
+    async def _tg_drain(self):
+        """알림 큐를 TELEGRAM_BATCH_DELAY 동안 모았다가 한 메시지로 묶어서 전송"""
+        queue = self._tg_queue
+        while True:
+            batch = await queue.get()
+            await asyncio.sleep(self.TELEGRAM_BATCH_DELAY)
+
+            while not queue.empty():
+                msg = queue.get_nowait()
+                # 텔레그램 길이 제한을 넘으면 지금까지 모은 것부터 전송
+                if len(batch) + 2 + len(msg) > MAX_MESSAGE_LENGTH:
+                    await send_telegram_message(batch)
+                    batch = msg
+                else:
+                    batch += "\n\n" + msg
+
+            await send_telegram_message(batch)
 
     async def stop(self):
+        for timer in self.flush_timers.values():
+            timer.cancel()
+        self.flush_timers.clear()
+
+        if self._tg_task:
+            self._tg_task.cancel()
+
         if self.client:
             await self.client.close_connection()
@@ -1,4 +1,5 @@
 import asyncio
+import sys
 from decimal import Decimal
 
 from telegram import Update
@@ -122,6 +123,13 @@ async def post_init(application):
 
 
 def main():
+    # 윈도우를 제외하면 uvloop 이벤트 루프 사용
+    # (run_polling이 현재 루프를 그대로 사용함)
+    if sys.platform != "win32":
+        import uvloop
+
+        asyncio.set_event_loop(uvloop.new_event_loop())
+
     application = ApplicationBuilder().token(TOKEN).post_init(post_init).build()
 
     application.add_handler(CommandHandler("start", start_command))
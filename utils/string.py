@@ -1,6 +1,19 @@
-from decimal import ROUND_DOWN, Decimal
+from decimal import ROUND_DOWN, Context, Decimal
+from functools import lru_cache
 
+# 자주 쓰는 quantize 단위는 미리 만들어 둠 (호출마다 문자열 파싱 방지)
+Q8 = Decimal("0.00000001")
+Q3 = Decimal("0.001")
+Q2 = Decimal("0.01")
 
+_QCACHE: dict[str, Decimal] = {"0.00000001": Q8, "0.001": Q3, "0.01": Q2}
+
+# 호출하는 쪽의 localcontext(낮은 정밀도 등)와 관계없이 항상 같은 결과를 내도록 고정
+_FMT_CTX = Context(prec=28)
+
+
+# 같은 (값, 자릿수) 조합은 반복해서 나오므로 결과를 캐싱 (Decimal은 hashable)
+@lru_cache(maxsize=4096)
 def f(value: Decimal, quantize_str: str = "0.00000001") -> str:
     """
     Decimal을 받아서 예쁜 문자열로 변환하는 함수
@@ -14,23 +27,26 @@ def f(value: Decimal, quantize_str: str = "0.00000001") -> str:
     # 1. 소수점 8자리까지만 남기고 버림 (Truncate)
     # 예: 10.123456789 -> 10.12345678
     # 예: 10.5 -> 10.50000000 (일단 0이 채워짐)
-    quantized = value.quantize(Decimal(quantize_str), rounding=ROUND_DOWN)
+    quantum = _QCACHE.get(quantize_str)
+    if quantum is None:
+        quantum = _QCACHE[quantize_str] = Decimal(quantize_str)
+    quantized = value.quantize(quantum, rounding=ROUND_DOWN, context=_FMT_CTX)
 
     # 2. 고정 소수점 문자열로 변환 ('f' 포맷은 과학적 표기법 1E-8 등을 방지함)
     s = format(quantized, "f")
 
-    # 3. 우측의 불필요한 '0'과 불필요한 소수점 '.' 제거 (Normalize 효과)
-    if "." in s:
-        s = s.rstrip("0").rstrip(".")
+    # 3. 정수부/소수부를 한 번에 나누고,
+    #    소수부 우측의 불필요한 '0' 제거 (Normalize 효과)
+    integer_part, _, decimal_part = s.partition(".")
+    decimal_part = decimal_part.rstrip("0")
 
     # 4. 정수부에 천 단위 콤마 찍기
-    if "." in s:
-        integer_part, decimal_part = s.split(".")
+    if decimal_part:
         return f"{int(integer_part):,}.{decimal_part}"
-    else:
-        return f"{int(s):,}"
+    return f"{int(integer_part):,}"
 
 
+@lru_cache(maxsize=4096)
 def price_f(value: Decimal, symbol: str):
     if symbol in ["BTCUSDT", "ETHUSDT"]:
         return f(value, "0.01")
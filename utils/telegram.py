@@ -1,3 +1,5 @@
+import logging
+
 from telegram import Bot
 
 from utils import get_required_env
@@ -6,6 +8,9 @@ TELEGRAM_TOKEN = get_required_env("TELEGRAM_TOKEN")
 CHAT_ID = get_required_env("TELEGRAM_CHAT_ID")
 TOPIC_ID = get_required_env("TELEGRAM_TOPIC_ID")
 
+# 텔레그램 메시지 최대 길이는 4096자, 여유를 두고 묶음 전송 상한으로 사용
+MAX_MESSAGE_LENGTH = 4000
+
 bot = Bot(token=TELEGRAM_TOKEN)
 
 
@@ -19,6 +24,7 @@ async def send_telegram_message(text: str):
             text=text,
             parse_mode="Markdown",
         )
-        print(f"[전송 완료] {CHAT_ID} {text}")
+        # 본문 전체를 다시 출력하지 않고 길이만 기록
+        logging.info(f"[전송 완료] {CHAT_ID} ({len(text)}자)")
     except Exception as e:
-        print(f"[전송 실패] {e}")
+        logging.error(f"[전송 실패] {e}")